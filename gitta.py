@@ -1,98 +1,482 @@
 #!/usr/bin/env python3
 
 import requests
+from requests.adapters import HTTPAdapter
 import sys
 import os
 import subprocess
 import argparse
-
-def run_git(command, directory, check=False):
+import io
+import asyncio
+import dbm
+from collections import OrderedDict
+import re
+import shelve
+import shutil
+import time
+from urllib.parse import parse_qs, urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Absolute path to git, resolved once rather than searching PATH on every call
+_GIT = shutil.which('git')
+if _GIT is None:
+    print("Error: 'git' command not found. Please ensure Git is installed and in your PATH")
+    sys.exit(1)
+
+# Environment for git subprocesses: skip optional index lock writes so concurrent
+# git processes do not contend, never block on a credential prompt, and avoid
+# locale conversion in output. Git also runs with no stdin and in its own session,
+# so ssh has no terminal to open passphrase or host key prompts on either.
+_GIT_ENV = {**os.environ, 'GIT_OPTIONAL_LOCKS': '0', 'GIT_TERMINAL_PROMPT': '0', 'LC_ALL': 'C'}
+
+# Number of repos processed concurrently
+MAX_WORKERS = 8
+
+# Parallel jobs git uses within a single fetch, for submodules
+FETCH_JOBS = 8
+
+# Repos fetched within this many seconds are not fetched again (0 always fetches)
+try:
+    FETCH_TTL = int(os.environ.get('GITTA_FETCH_TTL', 300))
+except ValueError:
+    print(f"WARNING: Ignoring invalid GITTA_FETCH_TTL '{os.environ['GITTA_FETCH_TTL']}', using 300")
+    FETCH_TTL = 300
+
+# Repo owner in HTTPS (https://github.com/owner/repo.git) and SSH (git@github.com:owner/repo.git) remote URLs
+_OWNER_RE = re.compile(r'^(?:https?://[^/]+/|git@[^:]+:)([^/]+)/')
+
+# On-disk cache of GitHub API responses, revalidated with ETags
+CACHE_PATH = os.path.expanduser("~/.cache/gitta/repos.db")
+
+# Global gitignore created on first update
+_GITIGNORE_PATH = os.path.expanduser("~/.gitignore_global")
+
+# Number of GitHub API pages fetched concurrently
+PAGE_WORKERS = 4
+
+# GitHub API headers; a token raises the rate limit from 60 to 5000 requests/hour
+_GITHUB_HEADERS = {'Accept': 'application/vnd.github+json'}
+if os.environ.get('GITHUB_TOKEN'):
+    _GITHUB_HEADERS['Authorization'] = f"Bearer {os.environ['GITHUB_TOKEN']}"
+
+# Shared session so all API requests reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.headers.update(_GITHUB_HEADERS)
+
+def run_git(command, directory, check=False, capture=True):
     """
     Runs a git command in a specified directory.
     If check is True, raises CalledProcessError on failure.
-    Returns the output.
+    If capture is False, output is discarded rather than piped and decoded.
+    Returns the output, or None when not capturing.
+    """
+    output = subprocess.PIPE if capture else subprocess.DEVNULL
+    result = subprocess.run(
+        [_GIT] + command,
+        cwd=directory,
+        env=_GIT_ENV,
+        stdin=subprocess.DEVNULL,
+        start_new_session=True,
+        stdout=output,
+        stderr=output,
+        text=capture,
+        check=check
+    )
+    return result.stdout.strip() if capture else None
+
+# Fixed-shape git commands bound once up front; call with the repo path
+_git_config_list = partial(run_git, ['config', '--local', '--list', '-z'])
+_git_fetch = partial(run_git, ['fetch', f'--jobs={FETCH_JOBS}'], check=True, capture=False)
+_git_merge_upstream = partial(run_git, ['merge', '--ff-only', '@{u}'], check=True, capture=False)
+
+def _common_dir(git_dir):
+    """
+    Returns the git dir shared by all worktrees of a repository. A linked
+    worktree's own git dir names it in a 'commondir' file, and holds no config.
+    """
+    try:
+        with open(os.path.join(git_dir, 'commondir')) as f:
+            return os.path.normpath(os.path.join(git_dir, f.read().strip()))
+    except OSError:
+        return git_dir
+
+def _read_local_config(repo_path):
+    """
+    Reads all local config entries of a repository with a single git call,
+    or in-process via pygit2 when it is installed.
+
+    Returns:
+        dict: Config values keyed by name, e.g. 'user.name' or 'remote.origin.url'.
+    """
+    if pygit2:
+        try:
+            repo = pygit2.Repository(repo_path)
+            local_config = pygit2.Config(os.path.join(_common_dir(repo.path), 'config'))
+            return {entry.name: entry.value for entry in local_config}
+        except pygit2.GitError:
+            pass  # Fall back to git, which copes with broken repos
+
+    output = _git_config_list(repo_path)
+    config = {}
+    for entry in output.split('\0'):
+        if entry:
+            # With -z each entry is the key, a newline, then the value
+            key, _, value = entry.partition('\n')
+            config[key] = value
+    return config
+
+def _fetched_recently(repo_path):
+    """
+    Checks whether a repository was fetched within the last FETCH_TTL seconds,
+    going by the mtime git leaves on FETCH_HEAD. An empty FETCH_HEAD does not
+    count, and _expire_fetch_head backdates it after a failed fetch.
     """
     try:
-        result = subprocess.run(
-            ['git'] + command,
-            cwd=directory,
-            capture_output=True,
-            text=True,
-            check=check
-        )
-        return result.stdout.strip()
-    except FileNotFoundError:
-        print("Error: 'git' command not found. Please ensure Git is installed and in your PATH")
-        sys.exit(1)
+        st = os.stat(f"{repo_path}/.git/FETCH_HEAD")
+    except OSError:
+        return False
+    return st.st_size > 0 and time.time() - st.st_mtime < FETCH_TTL
+
+def _expire_fetch_head(repo_path):
+    """
+    Backdates FETCH_HEAD so the next run fetches again. Used after a failed
+    fetch, which can still leave FETCH_HEAD non-empty (e.g. when only a
+    submodule fails).
+    """
+    try:
+        os.utime(f"{repo_path}/.git/FETCH_HEAD", (0, 0))
+    except OSError:
+        pass
+
+def _is_worktree_clean(repo_path):
+    """
+    Checks whether a repository has no uncommitted changes to tracked files.
+    Any status output at all means the tree is dirty, so only its first byte is
+    read and git is stopped early rather than listing every change.
+    """
+    if pygit2:
+        try:
+            return not pygit2.Repository(repo_path).status(untracked_files='no')
+        except pygit2.GitError:
+            pass  # Fall back to git, which copes with broken repos
+
+    with subprocess.Popen(
+        [_GIT, 'status', '--porcelain', '--untracked-files=no'],
+        cwd=repo_path,
+        env=_GIT_ENV,
+        stdin=subprocess.DEVNULL,
+        start_new_session=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    ) as process:
+        if process.stdout.read(1):
+            process.terminate()
+            return False
+        return process.wait() == 0
 
 def get_repo_owner(remote_url):
     """
     Extracts the repository owner from a git remote URL.
     """
-    if remote_url.startswith('https://'):
-        # HTTPS format: https://github.com/owner/repo.git
-        parts = remote_url.split('/')
-        if len(parts) >= 4:
-            return parts[-2]
-    elif remote_url.startswith('git@'):
-        # SSH format: git@github.com:owner/repo.git
-        parts = remote_url.split(':')
-        if len(parts) >= 2:
-            owner_and_repo = parts[1].split('/')
-            return owner_and_repo[0]
-    return None
+    match = _OWNER_RE.match(remote_url)
+    return match.group(1) if match else None
 
-def list_github_repos(username):
+def _load_cache(urls):
     """
-    Lists all public GitHub repos for a given username.
+    Reads the cache entries for the given urls. The cache is only an
+    optimization, so if it cannot be opened (read-only home, another gitta
+    holding the lock) no entries are returned.
+
+    Returns:
+        dict: Cache entries keyed by url, None for urls not cached.
+    """
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with shelve.open(CACHE_PATH) as cache:
+            return {url: cache.get(url) for url in urls}
+    except dbm.error:  # a tuple that includes OSError
+        return dict.fromkeys(urls)
+
+def _save_cache(entries):
+    """
+    Writes cache entries keyed by url, skipping the cache if it cannot be opened.
+    """
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with shelve.open(CACHE_PATH) as cache:
+            cache.update(entries)
+    except dbm.error:  # a tuple that includes OSError
+        pass
+
+def _page_entry(status_code, cached, etag=None, repos=None, last_url=None):
+    """
+    Builds the cache entry for a fetched page of repos. Shared by the requests
+    and aiohttp paths.
+
+    Args:
+        status_code (int): The HTTP status of the response.
+        cached (dict): The cache entry sent for revalidation, or None.
+        etag (str): The response's ETag header.
+        repos (list): The decoded response body, on a 200.
+        last_url (str): The url of the Link header's rel="last" page, if any.
+
+    Returns:
+        tuple: (status_code, entry) where entry is a dict with 'etag', 'repo_names'
+        and 'last_page', or None on error.
+    """
+    if status_code == 304:
+        entry = dict(cached)
+    elif status_code == 200:
+        entry = {
+            'etag': etag,
+            'repo_names': [repo['name'] for repo in repos],
+            'last_page': 1,
+        }
+    else:
+        return status_code, None
+
+    # GitHub advertises the page count in the Link header's rel="last" url
+    if last_url:
+        entry['last_page'] = int(parse_qs(urlparse(str(last_url)).query)['page'][0])
+    return 200, entry
+
+def _get_page(url, cached):
+    """
+    Fetches a page of repos from the GitHub API, revalidating any cached copy.
+    Sends the cached ETag as If-None-Match, so an unchanged page comes back as
+    an empty 304 that does not count against the rate limit.
+
+    Args:
+        url (str): The GitHub API url.
+        cached (dict): The cache entry for url, or None.
+
+    Returns:
+        tuple: (status_code, entry) as returned by _page_entry.
+    """
+    headers = {'If-None-Match': cached['etag']} if cached else {}
+    response = _SESSION.get(url, headers=headers)
+    repos = response.json() if response.status_code == 200 else None
+    last_url = response.links.get('last', {}).get('url')
+    return _page_entry(response.status_code, cached, response.headers.get('ETag'), repos, last_url)
+
+async def _get_pages_async(urls, cached):
+    """
+    Fetches pages of repos concurrently on one aiohttp session, revalidating
+    cached copies the same way as _get_page.
+
+    Returns:
+        list: A (status_code, entry) tuple per url, in the same order.
+    """
+    async def get_page(session, url, cached_entry):
+        headers = {'If-None-Match': cached_entry['etag']} if cached_entry else {}
+        async with session.get(url, headers=headers) as response:
+            repos = await response.json() if response.status == 200 else None
+            last_url = response.links.get('last', {}).get('url')
+            return _page_entry(response.status, cached_entry, response.headers.get('ETag'), repos, last_url)
+
+    async with aiohttp.ClientSession(headers=_GITHUB_HEADERS) as session:
+        return await asyncio.gather(*[get_page(session, url, entry) for url, entry in zip(urls, cached)])
+
+def _iter_repo_names(url, first_page):
+    """
+    Yields the repo names of the first page, then those of the remaining pages
+    as they arrive, so callers can start on repos while later pages download.
+    Remaining pages are fetched concurrently, with aiohttp if it is installed.
+    """
+    page_urls = [f"{url}&page={page}" for page in range(2, first_page['last_page'] + 1)]
+    cached = list(_load_cache(page_urls).values())
+
+    updates = {}
+    # With aiohttp a single event loop fetches every page, so it needs only one thread
+    with ThreadPoolExecutor(max_workers=1 if aiohttp else PAGE_WORKERS) as executor:
+        if aiohttp:
+            async_pages = executor.submit(asyncio.run, _get_pages_async(page_urls, cached))
+        else:
+            pages = executor.map(_get_page, page_urls, cached)
+
+        yield from first_page['repo_names']
+
+        if aiohttp:
+            pages = async_pages.result()
+        for page_url, (status_code, entry) in zip(page_urls, pages):
+            if status_code != 200:
+                print(f"Error fetching repos from {page_url}. Status code: {status_code}")
+                continue
+            if entry['etag']:
+                updates[page_url] = entry
+            yield from entry['repo_names']
+
+    _save_cache(updates)
+
+def iter_github_repos(username):
+    """
+    Lists all public GitHub repos for a given username as an iterator that
+    yields names as pages arrive, so callers can start on repos early.
 
     Args:
         username (str): The GitHub username.
 
     Returns:
-        list: A list of repository names, or None if the user is not found.
+        iterator: Repository names, or None if the user is not found.
     """
-    url = f"https://api.github.com/users/{username}/repos"
-    response = requests.get(url)
+    url = f"https://api.github.com/users/{username}/repos?per_page=100"
+    status_code, first_page = _get_page(url, _load_cache([url])[url])
+    if first_page and first_page['etag']:
+        _save_cache({url: first_page})
 
-    if response.status_code == 200:
-        repos = response.json()
-        if not repos:
+    if status_code == 200:
+        if not first_page['repo_names']:
             print(f"User '{username}' has no public repos")
-            return []
-
-        repo_names = [repo['name'] for repo in repos]
-        return repo_names
-    elif response.status_code == 404:
+            return iter([])
+        if first_page['last_page'] == 1:
+            return iter(first_page['repo_names'])
+        return _iter_repo_names(url, first_page)
+    elif status_code == 404:
         print(f"User '{username}' not found")
         return None
     else:
-        print(f"Error fetching repos. Status code: {response.status_code}")
+        print(f"Error fetching repos. Status code: {status_code}")
         return None
 
-def _update_local_repo(repo_path, repo_name, clean_repos, wip_repos):
+def list_github_repos(username):
+    """
+    Lists all public GitHub repos for a given username.
+
+    Args:
+        username (str): The GitHub username.
+
+    Returns:
+        list: A list of repository names, or None if the user is not found.
+    """
+    repos = iter_github_repos(username)
+    return None if repos is None else list(repos)
+
+def _tracking_status(repo_path):
     """
-    Performs a fetch, status check, and conditional pull for a single repository.
-    Appends the repo name to the appropriate list.
+    Compares the current branch with its upstream using refs only, so no
+    further worktree scan is needed after the clean check.
+
+    Returns:
+        tuple: (branch, upstream, ahead, behind). branch is None for a detached
+        HEAD and upstream is None if there is none (or it is gone).
+    """
+    if pygit2:
+        try:
+            repo = pygit2.Repository(repo_path)
+            if repo.head_is_detached or repo.head_is_unborn:
+                return None, None, 0, 0
+            branch = repo.branches.local[repo.head.shorthand]
+            upstream = branch.upstream
+            if upstream is None:
+                return branch.branch_name, None, 0, 0
+            ahead, behind = repo.ahead_behind(branch.target, upstream.target)
+            return branch.branch_name, upstream.shorthand, ahead, behind
+        except (pygit2.GitError, KeyError):
+            pass  # Fall back to git, which copes with broken repos
+
+    output = run_git(['for-each-ref', '--format=%(HEAD)%00%(refname:short)%00%(upstream:short)%00%(upstream:track)', 'refs/heads'], repo_path)
+    for line in output.splitlines():
+        head, branch, upstream, track = line.split('\0')
+        if head == '*':
+            if not upstream or track == '[gone]':
+                return branch, None, 0, 0
+            ahead = re.search(r'ahead (\d+)', track)
+            behind = re.search(r'behind (\d+)', track)
+            return branch, upstream, int(ahead.group(1)) if ahead else 0, int(behind.group(1)) if behind else 0
+    return None, None, 0, 0
+
+def _format_branch_status(branch, upstream, ahead, behind):
+    """
+    Formats tracking status like git's short status branch line,
+    e.g. 'main...origin/main [ahead 1]'.
+    """
+    if branch is None:
+        return "HEAD (no branch)"
+    if upstream is None:
+        return branch
+    track = []
+    if ahead:
+        track.append(f"ahead {ahead}")
+    if behind:
+        track.append(f"behind {behind}")
+    return f"{branch}...{upstream} [{', '.join(track)}]" if track else f"{branch}...{upstream}"
+
+def _update_local_repo(repo_path, repo_name, out=None):
+    """
+    Performs a fetch, status check, and conditional fast-forward for a single repository.
+    Output goes to out (stdout by default).
+
+    Returns:
+        str: 'clean' if up to date with upstream (fast-forwarded if it was behind),
+        'wip' if the working tree has changes, 'diverged' if local and upstream
+        both have new commits, or None on error.
     """
     try:
-        run_git(['fetch'], repo_path, check=True)
-        status_output = run_git(['status'], repo_path)
-        print(status_output)
-        if "nothing to commit, working tree clean" in status_output:
-            run_git(['pull'], repo_path, check=True)
-            clean_repos.append(repo_name)
+        if _fetched_recently(repo_path):
+            print(f"Fetched within the last {FETCH_TTL}s. Skipping 'git fetch'", file=out)
         else:
-            print("\nWARNING: Working tree not clean or has pending changes. Skipping 'git pull'")
-            wip_repos.append(repo_name)
+            try:
+                _git_fetch(repo_path)
+            except subprocess.CalledProcessError:
+                _expire_fetch_head(repo_path)
+                raise
+
+        branch, upstream, ahead, behind = _tracking_status(repo_path)
+        if not _is_worktree_clean(repo_path):
+            print(f"Branch: {_format_branch_status(branch, upstream, ahead, behind)}", file=out)
+            print("\nWARNING: Working tree not clean or has pending changes. Skipping 'git pull'", file=out)
+            return 'wip'
+        if upstream is None:
+            print(f"Error updating '{repo_name}': no upstream branch to pull from", file=out)
+            return None
+        if ahead and behind:
+            print(f"Branch: {_format_branch_status(branch, upstream, ahead, behind)}", file=out)
+            print("\nWARNING: Local and upstream branches have diverged. Skipping 'git pull'", file=out)
+            return 'diverged'
+        if behind:
+            # Upstream refs are already fetched, so fast-forward rather than 'git pull' fetching again
+            _git_merge_upstream(repo_path)
+        print(f"Branch: {_format_branch_status(branch, upstream, ahead, 0)}", file=out)
+        return 'clean'
     except subprocess.CalledProcessError as e:
-        print(f"Error updating '{repo_name}': {e}")
-        return False
-    return True
+        print(f"Error updating '{repo_name}': {e}", file=out)
+        return None
+
+def _clone_or_update_repo(username, repo_name, directory):
+    """
+    Clones a single repository into directory, or updates it if already present.
+    Runs on a worker thread, so all output is buffered and returned rather than printed.
+    """
+    repo_path = f"{directory}/{repo_name}"
+    repo_url = f"https://github.com/{username}/{repo_name}.git"
+
+    out = io.StringIO()
+    if os.path.isdir(repo_path):
+        print(f"Updating '{repo_name}'..", file=out)
+        _update_local_repo(repo_path, repo_name, out)
+    else:
+        print(f"Cloning '{repo_name}'..", file=out)
+        try:
+            run_git(['clone', repo_url], directory, check=True, capture=False)
+        except subprocess.CalledProcessError as e:
+            print(f"Error cloning '{repo_name}': {e}", file=out)
+    return out.getvalue()
 
 def clone_or_pull_repos(username, repos):
     """
-    Clones or pulls all repos for a given username.
+    Clones or pulls all repos for a given username, several at a time.
 
     Args:
         username (str): The GitHub username.
@@ -101,23 +485,17 @@ def clone_or_pull_repos(username, repos):
     if not repos:
         return
 
-    clean_repos = []
-    wip_repos = []
+    current_dir = os.getcwd()
 
     print(f"Processing repos for '{username}'..")
-    for repo_name in repos:
-        repo_path = os.path.join(os.getcwd(), repo_name)
-        repo_url = f"https://github.com/{username}/{repo_name}.git"
-
-        if os.path.isdir(repo_path):
-            print(f"Updating '{repo_name}'..")
-            _update_local_repo(repo_path, repo_name, clean_repos, wip_repos)
-        else:
-            print(f"Cloning '{repo_name}'..")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Repos are submitted as they arrive, so cloning overlaps with listing later pages
+        futures = {executor.submit(_clone_or_update_repo, username, repo_name, current_dir): repo_name for repo_name in repos}
+        for future in as_completed(futures):
             try:
-                run_git(['clone', repo_url], os.getcwd(), check=True)
-            except subprocess.CalledProcessError as e:
-                print(f"Error cloning '{repo_name}': {e}")
+                sys.stdout.write(future.result())
+            except Exception as e:
+                sys.stdout.write(f"Error processing '{futures[future]}': {e}\n")
 
 def _prompt_for_identity(repo_name, known_identities):
     """
@@ -165,101 +543,136 @@ def _prompt_for_identity(repo_name, known_identities):
         except ValueError:
             print("Invalid input. Please enter a number or 'n'.")
 
+def _process_repo(repo_path, dir_name, config):
+    """
+    Checks the repo owner and updates a single repository.
+    Runs on a worker thread, so all output is buffered and returned rather than printed.
+
+    Returns:
+        tuple: (dir_name, state, owner_mismatch, output) where state is as returned by _update_local_repo.
+    """
+    local_username = config.get('user.name', '')
+    local_email = config.get('user.email', '')
+
+    out = io.StringIO()
+    print("\n" + "="*64, file=out)
+    print(f"    CHECKING REPO: {dir_name}", file=out)
+    print("="*64 + "\n", file=out)
+
+    # Step 1: Report local user.name and email (set beforehand on the main thread)
+    print("Step 1: check local user.name and email..", file=out)
+    print(f"Local user.name:  {local_username}", file=out)
+    print(f"Local user.email: {local_email}", file=out)
+
+    # Step 2: Compare local user to repo owner
+    print("\nStep 2: compare local user to repo owner..", file=out)
+    remote_url = config.get('remote.origin.url', '')
+    repo_owner = get_repo_owner(remote_url)
+    owner_mismatch = False
+
+    if not remote_url:
+        print("WARNING: No 'origin' remote found. Skipping owner check", file=out)
+    elif not repo_owner:
+        print(f"ERROR: Could not determine repo owner from remote URL: {remote_url}", file=out)
+    else:
+        if repo_owner and local_username and repo_owner in local_username:
+            print(f"OK: Local user.name ('{local_username}') matches repo owner ('{repo_owner}')", file=out)
+        else:
+            print(f"WARNING: Local user.name ('{local_username}') does NOT match repo owner ('{repo_owner}')", file=out)
+            owner_mismatch = True
+
+    print(f"\nStep 3: fetch and pull (if clean) in {dir_name}..", file=out)
+    state = _update_local_repo(repo_path, dir_name, out)
+
+    return dir_name, state, owner_mismatch, out.getvalue()
+
+def _format_repo_list(title, repos):
+    """
+    Formats a titled section of the repos summary, one repo per line, sorted
+    so the summary does not depend on the order workers finished in.
+    """
+    return "\n".join([title] + ([f"    {repo}" for repo in sorted(repos)] or ["  None"]))
+
 def update_repos():
     """
     Updates all local repos in the current directory with the logic from git-update.sh.
+    Identity prompts run serially first, then repos are fetched and pulled in parallel.
     """
-    clean_repos = []
-    wip_repos = []
-    owner_mismatch_repos = []
-    known_identities = []
+    # Most recently used first; keys are (username, email) tuples
+    known_identities = OrderedDict()
 
     current_dir = os.getcwd()
 
     # Create global gitignore if it doesn't exist
-    gitignore_path = os.path.expanduser("~/.gitignore_global")
-    if not os.path.exists(gitignore_path):
-        with open(gitignore_path, 'w') as f:
+    if not os.path.exists(_GITIGNORE_PATH):
+        with open(_GITIGNORE_PATH, 'w') as f:
             f.write(".DS_Store\n")
-        run_git(['config', '--global', 'core.excludesfile', gitignore_path], current_dir)
+        run_git(['config', '--global', 'core.excludesfile', _GITIGNORE_PATH], current_dir, capture=False)
         print("Global .gitignore created and configured successfully")
     else:
         print("Global .gitignore file already exists. Skipping creation")
 
-    for dir_name in os.listdir('.'):
-        repo_path = os.path.join(current_dir, dir_name)
-        if os.path.isdir(repo_path) and dir_name != '.' and '.git' in os.listdir(repo_path):
-            print("\n" + "="*64)
-            print(f"    CHECKING REPO: {dir_name}")
-            print("="*64 + "\n")
-
-            # Step 1: Check and set local user.name and email
-            print("Step 1: check local user.name and email..")
-            local_username = run_git(['config', '--local', 'user.name'], repo_path)
-            local_email = run_git(['config', '--local', 'user.email'], repo_path)
+    # Phase 1: check and set local user.name and email, prompting serially
+    repos = []
+    for entry in os.scandir(current_dir):
+        # DirEntry caches the type from the directory read; .git may be a dir or a gitdir file
+        if entry.is_dir() and os.path.exists(f"{entry.path}/.git"):
+            repo_path = entry.path
+            dir_name = entry.name
+            config = _read_local_config(repo_path)
+            local_username = config.get('user.name', '')
+            local_email = config.get('user.email', '')
 
             if not local_username or not local_email:
-                new_username, new_email = _prompt_for_identity(dir_name, known_identities)
+                new_username, new_email = _prompt_for_identity(dir_name, list(known_identities))
                 if new_username and new_email:
-                    run_git(['config', '--local', 'user.name', new_username], repo_path)
-                    run_git(['config', '--local', 'user.email', new_email], repo_path)
-                    local_username = new_username
-                    local_email = new_email
+                    run_git(['config', '--local', 'user.name', new_username], repo_path, capture=False)
+                    run_git(['config', '--local', 'user.email', new_email], repo_path, capture=False)
+                    config['user.name'] = local_username = new_username
+                    config['user.email'] = local_email = new_email
 
             if local_username and local_email:
                 identity = (local_username, local_email)
-                if identity in known_identities:
-                    known_identities.remove(identity)
-                known_identities.insert(0, identity)
-
-            print(f"Local user.name:  {local_username}")
-            print(f"Local user.email: {local_email}")
-
-            # Step 2: Compare local user to repo owner
-            print("\nStep 2: compare local user to repo owner..")
-            remote_url = run_git(['config', '--get', 'remote.origin.url'], repo_path)
-            repo_owner = get_repo_owner(remote_url)
-
-            if not remote_url:
-                print("WARNING: No 'origin' remote found. Skipping owner check")
-            elif not repo_owner:
-                print(f"ERROR: Could not determine repo owner from remote URL: {remote_url}")
-            else:
-                if repo_owner and local_username and repo_owner in local_username:
-                    print(f"OK: Local user.name ('{local_username}') matches repo owner ('{repo_owner}')")
-                else:
-                    print(f"WARNING: Local user.name ('{local_username}') does NOT match repo owner ('{repo_owner}')")
-                    owner_mismatch_repos.append(dir_name)
-
-            print(f"\nStep 3: fetch and pull (if clean) in {dir_name}..")
-            _update_local_repo(repo_path, dir_name, clean_repos, wip_repos)
-
-    print("\n" + "="*64)
-    print("    REPOS SUMMARY ")
-    print("="*64 + "\n")
-
-    print("CLEAN repos (working tree clean and pulled):")
-    if not clean_repos:
-        print("  None")
-    else:
-        for repo in clean_repos:
-            print(f"    {repo}")
+                known_identities[identity] = None
+                known_identities.move_to_end(identity, last=False)
 
-    print("\nWIP repos (working tree not clean or has pending changes):")
-    if not wip_repos:
-        print("  None")
-    else:
-        for repo in wip_repos:
-            print(f"    {repo}")
+            repos.append((repo_path, dir_name, config))
 
-    print("\nNON-OWNED repos (user and owner differ):")
-    if not owner_mismatch_repos:
-        print("  None")
-    else:
-        for repo in owner_mismatch_repos:
-            print(f"    {repo}")
+    # Phase 2: owner check, fetch and pull in parallel, printing each repo's output as it completes
+    clean_repos = []
+    wip_repos = []
+    diverged_repos = []
+    owner_mismatch_repos = []
 
-    print("\ndone!")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(_process_repo, *repo): repo[1] for repo in repos}
+        for future in as_completed(futures):
+            try:
+                dir_name, state, owner_mismatch, output = future.result()
+            except Exception as e:
+                # One broken repo must not abort the others or lose the summary
+                sys.stdout.write(f"\nError updating '{futures[future]}': {e}\n")
+                continue
+            sys.stdout.write(output)
+            if state == 'clean':
+                clean_repos.append(dir_name)
+            elif state == 'wip':
+                wip_repos.append(dir_name)
+            elif state == 'diverged':
+                diverged_repos.append(dir_name)
+            if owner_mismatch:
+                owner_mismatch_repos.append(dir_name)
+
+    sys.stdout.write("\n".join([
+        "\n" + "="*64,
+        "    REPOS SUMMARY ",
+        "="*64 + "\n",
+        _format_repo_list("CLEAN repos (working tree clean and pulled):", clean_repos),
+        _format_repo_list("\nWIP repos (working tree not clean or has pending changes):", wip_repos),
+        _format_repo_list("\nDIVERGED repos (local and upstream both have new commits):", diverged_repos),
+        _format_repo_list("\nNON-OWNED repos (user and owner differ):", owner_mismatch_repos),
+        "\ndone!\n",
+    ]))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Github repo management tool")
@@ -273,7 +686,11 @@ if __name__ == "__main__":
     if args.list or args.clone_all:
         if args.username is None:
             parser.error("The 'username' argument is required for --list or --clone-all options")
-        repos = list_github_repos(args.username)
+        if args.list:
+            repos = list_github_repos(args.username)
+        else:
+            # Clone-only runs start cloning while later pages still download
+            repos = iter_github_repos(args.username)
         if repos is not None:
             if args.list:
                 if repos: